@@ -1,6 +1,14 @@
-from . import app, socketio
-import logging
+from . import app, socketio, startup
+import json, logging, sys
 
 if __name__ == "__main__":
-    logging.getLogger(__name__).info("server_start port=5000 debug=False")
+    if "--startup-report" in sys.argv[1:]:
+        # Boot, serve one in-process request, print the timings as JSON on stdout and exit
+        # (for regression checks; boot messages go to stderr).
+        # This is a full boot: on a Pi, GpioManager drives the configured pins exactly as `python -m src` does.
+        # No startup work is deferred, so the report is complete once get("/") returns.
+        app.test_client().get("/")
+        print(json.dumps(startup.report(), indent=2))
+        sys.exit(0)
+    logging.getLogger(__name__).info("server_start port=5000 debug=False mode=%s", startup.MODE)
     socketio.run(app, host="0.0.0.0", port=5000, debug=False)
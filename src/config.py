@@ -50,8 +50,9 @@ def load_cfg(path: Path | None = None) -> dict:
     Load and return the JSON dict from cfg.json (creating it with defaults if missing).
     """
     p = Path(path) if path else initialize_config()
-    cfg = json.loads(p.read_text(encoding="utf-8"))
-    logging.getLogger(__name__).debug("config_load path=%s size=%dB", p, len(json.dumps(cfg)))
+    raw = p.read_text(encoding="utf-8")
+    cfg = json.loads(raw)
+    logging.getLogger(__name__).debug("config_load path=%s size=%dB", p, len(raw))
     return cfg
 
 def save_cfg(cfg: dict, path: Path | None = None) -> None:
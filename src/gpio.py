@@ -35,8 +35,7 @@ class GpioManager:
         self.socketio = socketio
         self.lock = threading.RLock()
         self.log = logging.getLogger(__name__)
-        initialize_config()
-        self.cfg = load_cfg()
+        self.cfg = load_cfg(initialize_config())
         self._last_inputs: Dict[int, int] = {} # Remembers the last state
         self._setup_hw()
 
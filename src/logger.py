@@ -1,13 +1,15 @@
 from __future__ import annotations
 from pathlib import Path
 from datetime import datetime, timedelta, time as dtime
-import logging
+import json, logging, re, sys
 import threading, time
 
 LOGS_DIR = Path(__file__).resolve().parents[1] / "data" / "logs"
+LOG_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
 
 _current_date: str | None = None
 _file_handler: logging.FileHandler | None = None
+_sio_lock = threading.Lock()
 
 def today_str() -> str:                  # ← public helper
     return datetime.now().strftime("%Y-%m-%d")
@@ -41,7 +43,7 @@ def bind_logger_to_today() -> Path:
     path.touch(exist_ok=True)
     fh = logging.FileHandler(path)
     fh.setLevel(logging.INFO)  # <-- ensure handler passes INFO
-    fh.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    fh.setFormatter(logging.Formatter(LOG_FORMAT))
     root.addHandler(fh)
 
     # IMPORTANT: don’t guard this; set the root logger level to INFO
@@ -49,24 +51,176 @@ def bind_logger_to_today() -> Path:
 
     _file_handler = fh
     _current_date = today
-    print(f"[logs] Bound file handler to {path}")
+    print(f"[logs] Bound file handler to {path}", file=sys.stderr)
     return path
 
+# Matches the first line of a record written with LOG_FORMAT
+_LINE_RE = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} (\w+) (\S+): ")
+
+_MAX_PREFIXES = 16
+_MAX_CONTAINS = 200
+
+class LogFilter:
+    """
+    Live-log subscription filter: minimum level, logger-name prefixes, substring.
+    Equal filters share one Socket.IO room (see `room`).
+    """
+    __slots__ = ("level", "prefixes", "contains", "room")
+
+    def __init__(self, level: int = logging.INFO, prefixes: tuple[str, ...] = (), contains: str = ""):
+        self.level = int(level)
+        self.prefixes = tuple(sorted(set(p for p in prefixes if p)))
+        self.contains = contains or ""
+        self.room = "log:" + json.dumps([self.level, self.prefixes, self.contains], separators=(",", ":"))
+
+    @classmethod
+    def from_payload(cls, data: dict | None) -> "LogFilter":
+        """
+        Build from a client payload {"level", "prefixes", "contains"}; all keys optional.
+        Raises ValueError on bad input.
+        """
+        data = data or {}
+        if not isinstance(data, dict):
+            raise ValueError("filter must be an object")
+
+        level = data.get("level")
+        if level is None or level == "":
+            level = logging.INFO
+        elif isinstance(level, str) and not level.strip().isdigit():
+            named = logging.getLevelName(level.strip().upper())
+            if not isinstance(named, int):
+                raise ValueError(f"unknown level {level[:32]!r}")
+            level = named
+        try:
+            level = int(level)
+        except (TypeError, ValueError):
+            raise ValueError("level must be a name or an integer") from None
+
+        prefixes = data.get("prefixes") or ()
+        if isinstance(prefixes, str):
+            prefixes = prefixes.split(",")
+        prefixes = tuple(str(p).strip() for p in prefixes)
+        if len(prefixes) > _MAX_PREFIXES:
+            raise ValueError(f"too many prefixes (max {_MAX_PREFIXES})")
+
+        contains = str(data.get("contains") or "")
+        if len(contains) > _MAX_CONTAINS:
+            raise ValueError(f"contains too long (max {_MAX_CONTAINS})")
+
+        return cls(level, prefixes, contains)
+
+    def to_payload(self) -> dict:
+        # unnamed levels (e.g. 25) stay numeric so from_payload accepts them back
+        name = logging.getLevelName(self.level)
+        return {
+            "level": name if logging.getLevelName(name) == self.level else self.level,
+            "prefixes": list(self.prefixes),
+            "contains": self.contains,
+        }
+
+    def _name_ok(self, name: str) -> bool:
+        if not self.prefixes:
+            return True
+        # hierarchy-aware, like logging itself: "src.gpio" matches "src.gpio" and "src.gpio.x"
+        return any(name == p or name.startswith(p + ".") for p in self.prefixes)
+
+    def matches(self, levelno: int, name: str, line: str) -> bool:
+        return levelno >= self.level and self._name_ok(name) and (not self.contains or self.contains in line)
+
+def filter_log_text(text: str, flt: LogFilter) -> str:
+    """
+    Apply `flt` to a log file written with LOG_FORMAT.
+    A record is its header line plus any continuation lines (tracebacks), and
+    `contains` is checked against all of it, as SocketIOHandler does live.
+    """
+    out: list[str] = []
+    record: list[str] = []
+    levelno, name = logging.NOTSET, ""
+
+    def flush():
+        if record and flt.matches(levelno, name, "".join(record)):
+            out.extend(record)
+
+    for line in text.splitlines(keepends=True):
+        m = _LINE_RE.match(line)
+        if m:
+            flush()
+            record = []
+            levelno = logging.getLevelName(m.group(1))
+            levelno = levelno if isinstance(levelno, int) else logging.NOTSET
+            name = m.group(2)
+        record.append(line)
+    flush()
+    return "".join(out)
+
 class SocketIOHandler(logging.Handler):
-    """Send log lines to all connected clients via Socket.IO."""
+    """
+    Send log lines to subscribed clients via Socket.IO.
+    Each distinct LogFilter is a room; a record is formatted once and checked
+    once per room, so the cost follows the number of filters, not clients.
+    """
     def __init__(self, socketio, event: str = "log_line"):
         super().__init__()
         self.socketio = socketio
         self.event = event
+        self._sub_lock = threading.Lock()
+        self._filters: dict[str, LogFilter] = {}   # room -> filter
+        self._members: dict[str, int] = {}         # room -> subscriber count
+        self._sid_room: dict[str, str] = {}        # sid -> room
+
+    def subscribe(self, sid: str, flt: LogFilter) -> str | None:
+        """Register `sid` under `flt`. Returns the room it left (if any) so the caller can leave it."""
+        with self._sub_lock:
+            old = self._sid_room.get(sid)
+            if old == flt.room:
+                return None
+            if old is not None:
+                self._release(old)
+            self._sid_room[sid] = flt.room
+            self._filters.setdefault(flt.room, flt)
+            self._members[flt.room] = self._members.get(flt.room, 0) + 1
+            return old
+
+    def unsubscribe(self, sid: str) -> str | None:
+        """Drop `sid`'s subscription. Returns the room it was in, or None."""
+        with self._sub_lock:
+            room = self._sid_room.pop(sid, None)
+            if room is not None:
+                self._release(room)
+            return room
+
+    def _release(self, room: str) -> None:
+        n = self._members.get(room, 0) - 1
+        if n > 0:
+            self._members[room] = n
+        else:
+            self._members.pop(room, None)
+            self._filters.pop(room, None)
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
-            msg = self.format(record)
-            self.socketio.emit(self.event, {"line": msg})
+            filters = list(self._filters.values())  # snapshot; no lock needed to read
+            if not filters:
+                return
+            msg = None
+            for flt in filters:
+                if record.levelno < flt.level or not flt._name_ok(record.name):
+                    continue
+                if msg is None:
+                    msg = self.format(record)
+                if flt.contains and flt.contains not in msg:
+                    continue
+                self.socketio.emit(self.event, {"line": msg}, to=flt.room)
         except Exception as e:
-            print(f"[SocketIOHandler] emit failed: {e!r}")
+            print(f"[SocketIOHandler] emit failed: {e!r}", file=sys.stderr)
             pass
 
+def get_socketio_handler() -> SocketIOHandler | None:
+    for h in logging.getLogger().handlers:
+        if isinstance(h, SocketIOHandler):
+            return h
+    return None
+
 def schedule_midnight_rotation() -> None:
     def _loop():
         while True:
@@ -78,13 +232,24 @@ def schedule_midnight_rotation() -> None:
     t = threading.Thread(target=_loop, daemon=True)
     t.start()
 
-def init_logging(socketio) -> None:
+def ensure_socketio_handler(socketio) -> SocketIOHandler:
+    """Attach the live-log handler to the root logger if it is not there yet."""
+    with _sio_lock:
+        h = get_socketio_handler()
+        if h is None:
+            h = SocketIOHandler(socketio)
+            h.setLevel(logging.INFO)
+            h.setFormatter(logging.Formatter(LOG_FORMAT))
+            logging.getLogger().addHandler(h)
+        return h
+
+def init_logging(socketio, *, lazy: bool = False) -> None:
+    """
+    File logging and midnight rotation always start right away. With lazy=True
+    the Socket.IO handler is attached on the first live-log subscription.
+    """
     bind_logger_to_today()
-    root = logging.getLogger()
-    if not any(isinstance(h, SocketIOHandler) for h in root.handlers):
-        sio_handler = SocketIOHandler(socketio)
-        sio_handler.setLevel(logging.INFO)
-        sio_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
-        root.addHandler(sio_handler)
+    if not lazy:
+        ensure_socketio_handler(socketio)
     schedule_midnight_rotation()
-    logging.getLogger(__name__).info("Live logging ready")
+    logging.getLogger(__name__).info("Live logging ready lazy=%s", lazy)
@@ -1,26 +1,40 @@
 from __future__ import annotations
 import logging
-from flask import Blueprint, render_template, redirect, send_file, url_for, jsonify, request
+from flask import Blueprint, abort, render_template, redirect, send_file, url_for, jsonify, request
+from flask_socketio import join_room, leave_room
 from pathlib import Path
 from .gpio import GpioManager
+from .logger import LogFilter, filter_log_text, get_socketio_handler, ensure_socketio_handler
+from . import startup
 from .utils import (
     today_str, date_to_compact, compact_to_date,
     LOGS_DIR,
     log_path_for_date,
     list_log_compacts,
     _secure_log_from_compact_or_404,
-    _read_cpu
+    _cpu_percent
 )
 
 def create_app(app, socketio):
     bp = Blueprint("main", __name__)
     log = logging.getLogger(__name__)
-    gpio = GpioManager(socketio)
+    lazy = startup.is_lazy()
+    # Pins are driven to their configured values at boot, so GPIO is never deferred
+    with startup.phase("routes.gpio"):
+        gpio = GpioManager(socketio)
 
     # helper: best-effort client ip
     def _client_ip():
         return request.headers.get("X-Forwarded-For", request.remote_addr or "-")
 
+    # helper: live-log filter from query args (?level=WARNING&logger=src.gpio&q=text)
+    def _log_filter_from_args():
+        return LogFilter.from_payload({
+            "level": request.args.get("level"),
+            "prefixes": request.args.getlist("logger"),
+            "contains": request.args.get("q"),
+        })
+
     @bp.get("/")
     def index():
         return render_template("index.html")
@@ -34,9 +48,14 @@ def create_app(app, socketio):
     @bp.get("/stream/logs/<compact>")
     def stream_logs_page(compact: str):
         path: Path = _secure_log_from_compact_or_404(compact)
-        initial = path.read_text(encoding="utf-8")
+        try:
+            flt = _log_filter_from_args()
+        except ValueError as e:
+            abort(400, description=str(e))
+        initial = filter_log_text(path.read_text(encoding="utf-8"), flt)
         live = (compact_to_date(compact) == today_str())
-        files = list_log_compacts(LOGS_DIR, exclude_today=True)
+        # lazy: the picker fetches /api/logs when first opened
+        files = None if lazy else list_log_compacts(LOGS_DIR, exclude_today=True)
         return render_template(
             "stream.html",
             title=f"Logs · {compact}",
@@ -47,8 +66,13 @@ def create_app(app, socketio):
             files=files,
             current_name=compact,
             picker_base="/stream/logs",
+            log_filter=flt.to_payload(),
         )
 
+    @bp.get("/api/logs")
+    def api_logs_list():
+        return jsonify(list_log_compacts(LOGS_DIR, exclude_today=True))
+
     @bp.get("/download/logs/<compact>")
     def logs_download(compact: str):
         path: Path = _secure_log_from_compact_or_404(compact)
@@ -109,7 +133,7 @@ def create_app(app, socketio):
     # ---------- SYSTEM: summary ----------
     @bp.get("/api/sys")
     def api_sys():
-        import shutil, time
+        import shutil
 
         # RAM via /proc/meminfo
         ram_total = ram_used = None
@@ -135,11 +159,10 @@ def create_app(app, socketio):
         except Exception:
             pass
 
-        # CPU via /proc/stat (short delta)
+        # CPU via /proc/stat (short delta; lazy: since previous poll)
         cpu = None
         try:
-            i1, t1 = _read_cpu(); time.sleep(0.1); i2, t2 = _read_cpu()
-            cpu = (1 - (i2 - i1) / max(1, (t2 - t1))) * 100.0
+            cpu = _cpu_percent(lazy=lazy)
         except Exception:
             cpu = 0.0
 
@@ -149,9 +172,50 @@ def create_app(app, socketio):
             "disk": {"used": disk_used, "total": disk_total} if disk_total is not None else None,
         })
 
+    # ---------- STARTUP: timing report ----------
+    @bp.get("/api/startup")
+    def api_startup():
+        return jsonify(startup.report())
+
+    @app.after_request
+    def _first_response(resp):
+        startup.mark_first_response()
+        return resp
+
     # ---------- Socket.IO ----------
     @socketio.on("connect")
     def _connect():
         socketio.emit("server_message", {"message": "Connected!"})
 
+    # Live logs: one room per distinct filter; the handler only emits to rooms
+    @socketio.on("log_subscribe")
+    def _log_subscribe(data=None):
+        try:
+            flt = LogFilter.from_payload(data)
+        except (TypeError, ValueError) as e:
+            # no payload in the log: it is client-controlled and this line is itself streamed live
+            log.warning("log_subscribe sid=%s ok=0 err=%s", request.sid, e)
+            return {"ok": False, "error": str(e)}
+        handler = ensure_socketio_handler(socketio)
+        old = handler.subscribe(request.sid, flt)
+        if old is not None:
+            leave_room(old)
+        join_room(flt.room)
+        log.info("log_subscribe sid=%s room=%s ok=1", request.sid, flt.room)
+        return {"ok": True, "filter": flt.to_payload()}
+
+    @socketio.on("log_unsubscribe")
+    def _log_unsubscribe(data=None):
+        handler = get_socketio_handler()
+        room = handler.unsubscribe(request.sid) if handler else None
+        if room is not None:
+            leave_room(room)
+        return {"ok": True}
+
+    @socketio.on("disconnect")
+    def _disconnect(*_):
+        handler = get_socketio_handler()
+        if handler:
+            handler.unsubscribe(request.sid)
+
     app.register_blueprint(bp)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+from contextlib import contextmanager
+import logging
+import os
+import threading, time
+
+# Taken as early as possible: `src/__init__.py` imports this module first.
+_T0 = time.perf_counter()
+
+# RPI_STARTUP=lazy defers optional subsystems until first use; anything else is eager.
+MODE = "lazy" if os.environ.get("RPI_STARTUP", "").strip().lower() == "lazy" else "eager"
+
+_lock = threading.Lock()
+_phases: list[tuple[str, float, float]] = []   # (name, start offset, duration) in seconds
+_ready_at: float | None = None
+_first_response_at: float | None = None
+
+def is_lazy() -> bool:
+    return MODE == "lazy"
+
+@contextmanager
+def phase(name: str):
+    """
+    Time a startup phase. Dotted names ("routes.gpio") are nested inside their
+    parent phase, so their time is already counted there.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        with _lock:
+            _phases.append((name, start - _T0, end - start))
+
+def mark_ready() -> None:
+    """Record the end of initialization and log the per-phase summary."""
+    global _ready_at
+    _ready_at = time.perf_counter()
+    with _lock:
+        top = [(n, d) for n, _, d in _phases if "." not in n]
+    logging.getLogger(__name__).info(
+        "startup_ready mode=%s total_ms=%.1f %s",
+        MODE, (_ready_at - _T0) * 1000,
+        " ".join(f"{n}_ms={d * 1000:.1f}" for n, d in top),
+    )
+
+def mark_first_response() -> None:
+    """Called once per response; only the first one is recorded."""
+    global _first_response_at
+    if _first_response_at is not None:
+        return
+    with _lock:
+        if _first_response_at is not None:
+            return
+        _first_response_at = time.perf_counter()
+    logging.getLogger(__name__).info(
+        "startup_first_response ms=%.1f", (_first_response_at - _T0) * 1000
+    )
+
+def report() -> dict:
+    """Startup timings in milliseconds since `src` began importing."""
+    ms = lambda v: None if v is None else round(v * 1000, 1)
+    with _lock:
+        phases = [{"name": n, "start_ms": ms(s), "ms": ms(d)} for n, s, d in _phases]
+    return {
+        "mode": MODE,
+        "phases": phases,
+        "ready_ms": ms(_ready_at - _T0 if _ready_at else None),
+        "first_response_ms": ms(_first_response_at - _T0 if _first_response_at else None),
+    }
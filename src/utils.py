@@ -88,3 +88,38 @@ def _read_cpu():
         idle = vals[3] + vals[4]
         total = sum(vals)
         return idle, total
+
+_cpu_last: float | None = None
+_cpu_lock = threading.Lock()
+_cpu_thread: threading.Thread | None = None
+
+def _cpu_sampler_loop(interval_s: float) -> None:
+    global _cpu_last
+    i1, t1 = _read_cpu()
+    while True:
+        time.sleep(interval_s)
+        try:
+            i2, t2 = _read_cpu()
+        except Exception:
+            continue
+        if t2 > t1:
+            _cpu_last = (1 - (i2 - i1) / (t2 - t1)) * 100.0
+            i1, t1 = i2, t2
+
+def _cpu_percent(*, lazy: bool = False, sample_s: float = 0.1, interval_s: float = 2.0) -> float | None:
+    """
+    CPU busy % from /proc/stat.
+    Eager: sample twice `sample_s` apart (blocks the request).
+    Lazy: one background sampler, started on first call, measures every `interval_s`
+    and callers read its last value; the first call takes one blocking sample to seed it.
+    """
+    global _cpu_last, _cpu_thread
+    if not lazy:
+        i1, t1 = _read_cpu(); time.sleep(sample_s); i2, t2 = _read_cpu()
+        return (1 - (i2 - i1) / max(1, (t2 - t1))) * 100.0
+    with _cpu_lock:
+        if _cpu_thread is None:
+            _cpu_last = _cpu_percent(sample_s=sample_s)
+            _cpu_thread = threading.Thread(target=_cpu_sampler_loop, args=(interval_s,), daemon=True)
+            _cpu_thread.start()
+    return _cpu_last
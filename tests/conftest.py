@@ -0,0 +1,19 @@
+import os
+
+# Must be set before `src` is imported: the startup mode is read once at import time
+os.environ.setdefault("RPI_STARTUP", "lazy")
+
+import pytest
+
+
+@pytest.fixture
+def app():
+    from src import app as flask_app
+    flask_app.config["TESTING"] = True
+    return flask_app
+
+
+@pytest.fixture
+def client(app):
+    # same name as pytest-flask's fixture, so the suite also runs without that plugin
+    return app.test_client()
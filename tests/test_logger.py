@@ -0,0 +1,149 @@
+import logging
+import sys
+
+import pytest
+
+from src.logger import LOG_FORMAT, LogFilter, SocketIOHandler, filter_log_text
+
+
+class _FakeSocketIO:
+    def __init__(self):
+        self.sent = []
+
+    def emit(self, event, data, to=None):
+        self.sent.append((to, data["line"]))
+
+
+def _record(name, level, msg):
+    return logging.LogRecord(name, level, __file__, 1, msg, None, None)
+
+
+def _handler():
+    sio = _FakeSocketIO()
+    h = SocketIOHandler(sio)
+    h.setFormatter(logging.Formatter(LOG_FORMAT))
+    return h, sio
+
+
+def test_filter_from_payload_defaults():
+    flt = LogFilter.from_payload(None)
+    assert (flt.level, flt.prefixes, flt.contains) == (logging.INFO, (), "")
+    assert LogFilter.from_payload({"level": ""}).level == logging.INFO
+    assert LogFilter.from_payload({"level": "warning", "prefixes": "b,a"}).prefixes == ("a", "b")
+
+
+@pytest.mark.parametrize("level", [0, "0"])
+def test_filter_from_payload_keeps_explicit_zero_level(level):
+    assert LogFilter.from_payload({"level": level}).level == 0
+
+
+@pytest.mark.parametrize("bad", [
+    {"level": "nope"},
+    {"level": {"x": 1}},
+    {"prefixes": ["p"] * 17},
+    {"contains": "x" * 201},
+    ["not", "a", "dict"],
+])
+def test_filter_from_payload_rejects_bad_input(bad):
+    with pytest.raises(ValueError):
+        LogFilter.from_payload(bad)
+
+
+def test_filter_payload_round_trip_keeps_unnamed_levels():
+    for level in ("WARNING", 25, "5"):
+        flt = LogFilter.from_payload({"level": level, "prefixes": ["src.gpio"], "contains": "x"})
+        again = LogFilter.from_payload(flt.to_payload())
+        assert again.room == flt.room
+
+
+def test_prefix_match_is_hierarchy_aware():
+    flt = LogFilter(prefixes=("src.gpio",))
+    assert flt.matches(logging.INFO, "src.gpio", "")
+    assert flt.matches(logging.INFO, "src.gpio.x", "")
+    assert not flt.matches(logging.INFO, "src.gpiox", "")
+
+
+def _rooms_for(h, sio, record):
+    sio.sent.clear()
+    h.handle(record)
+    return [to for to, _ in sio.sent]
+
+
+def test_subscribe_resubscribe_and_unsubscribe_route_emits():
+    h, sio = _handler()
+    warn = _record("src.gpio", logging.WARNING, "edge")
+    a = LogFilter(logging.WARNING, ("src.gpio",))
+    b = LogFilter(logging.WARNING, ("src.gpio",))
+    other = LogFilter()
+
+    # equal filters share one room: one emit for two subscribers
+    assert h.subscribe("s1", a) is None
+    assert h.subscribe("s2", b) is None
+    assert _rooms_for(h, sio, warn) == [a.room]
+
+    # re-subscribing moves the sid and reports the room it left; the shared room stays while s2 is in it
+    assert h.subscribe("s1", other) == a.room
+    assert sorted(_rooms_for(h, sio, warn)) == sorted([a.room, other.room])
+
+    # the last subscriber leaving drops the room
+    assert h.unsubscribe("s2") == a.room
+    assert h.unsubscribe("s2") is None
+    assert _rooms_for(h, sio, warn) == [other.room]
+
+    assert h.unsubscribe("s1") == other.room
+    assert _rooms_for(h, sio, warn) == []
+
+
+def test_emit_sends_once_per_matching_room():
+    h, sio = _handler()
+    gpio_warn = LogFilter(logging.WARNING, ("src.gpio",))
+    everything = LogFilter()
+    h.subscribe("s1", gpio_warn)
+    h.subscribe("s2", gpio_warn)
+    h.subscribe("s3", everything)
+
+    h.handle(_record("src.routes", logging.INFO, "api_gpio_set"))
+    h.handle(_record("src.gpio", logging.WARNING, "edge"))
+
+    rooms = [to for to, _ in sio.sent]
+    assert rooms == [everything.room, gpio_warn.room, everything.room]
+
+
+def test_emit_without_subscribers_sends_nothing():
+    h, sio = _handler()
+    h.handle(_record("src", logging.ERROR, "boom"))
+    assert sio.sent == []
+
+
+TEXT = (
+    "2025-01-01 10:00:00,123 INFO src.routes: a\n"
+    "2025-01-01 10:00:01,123 ERROR src.gpio: b\n"
+    "Traceback (most recent call last):\n"
+    "  ValueError: needle\n"
+    "2025-01-01 10:00:02,123 INFO src.gpio: c\n"
+)
+
+
+def test_filter_log_text_keeps_continuation_lines_with_their_record():
+    out = filter_log_text(TEXT, LogFilter(logging.WARNING, ("src.gpio",)))
+    assert out == (
+        "2025-01-01 10:00:01,123 ERROR src.gpio: b\n"
+        "Traceback (most recent call last):\n"
+        "  ValueError: needle\n"
+    )
+
+
+def test_filter_log_text_matches_contains_like_live_stream():
+    flt = LogFilter(contains="needle")
+    out = filter_log_text(TEXT, flt)
+    assert out.startswith("2025-01-01 10:00:01,123 ERROR src.gpio: b\n")
+
+    # the live handler makes the same decision for the same record
+    h, sio = _handler()
+    h.subscribe("s1", flt)
+    try:
+        raise ValueError("needle")
+    except ValueError:
+        rec = logging.LogRecord("src.gpio", logging.ERROR, __file__, 1, "b", None, sys.exc_info())
+    h.handle(rec)
+    assert len(sio.sent) == 1
@@ -0,0 +1,12 @@
+from src.utils import date_to_compact, today_str
+
+
+def test_stream_page_filters_and_rejects_bad_filter(client):
+    compact = date_to_compact(today_str())
+    ok = client.get(f"/stream/logs/{compact}?level=25&logger=src.gpio")
+    assert ok.status_code == 200
+    assert b"&#34;level&#34;: 25" in ok.data
+
+    bad = client.get(f"/stream/logs/{compact}?level=nope")
+    assert bad.status_code == 400
+    assert bad.mimetype == "text/html"
@@ -0,0 +1,82 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src import startup, utils
+
+ROOT = Path(__file__).resolve().parents[1]
+PHASES = ["import", "app", "logging.import", "logging", "routes.import", "routes.gpio", "routes"]
+
+
+def _run(mode, *args):
+    env = {**os.environ, "RPI_STARTUP": mode}
+    out = subprocess.run(
+        [sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True, timeout=60, check=True
+    )
+    return out.stdout
+
+
+def _check_report(report, mode):
+    assert report["mode"] == mode
+    assert [p["name"] for p in report["phases"]] == PHASES
+    for p in report["phases"]:
+        assert p["ms"] >= 0 and p["start_ms"] >= 0
+    assert 0 < report["ready_ms"] <= report["first_response_ms"]
+
+
+@pytest.mark.parametrize("mode", ["lazy", "eager"])
+def test_startup_report_command_prints_json(mode):
+    _check_report(json.loads(_run(mode, "-m", "src", "--startup-report")), mode)
+
+
+def test_lazy_startup_report(client):
+    assert startup.MODE == "lazy"
+    assert client.get("/").status_code == 200
+    _check_report(startup.report(), "lazy")
+    assert client.get("/api/startup").get_json()["phases"] == startup.report()["phases"]
+
+
+def test_lazy_mode_defers_socketio_handler_and_archive_list(client):
+    from src.logger import get_socketio_handler
+    page = client.get("/logs", follow_redirects=True)
+    assert b"data-src=" in page.data
+    assert get_socketio_handler() is None
+
+
+EAGER_CHECK = """
+from src import app
+from src.logger import get_socketio_handler
+page = app.test_client().get("/logs", follow_redirects=True)
+print(get_socketio_handler() is not None, b"data-src=" in page.data, page.status_code)
+"""
+
+
+def test_eager_mode_attaches_handler_and_renders_archive_list():
+    assert _run("eager", "-c", EAGER_CHECK).split() == ["True", "False", "200"]
+
+
+def test_eager_cpu_percent_samples_inline(monkeypatch):
+    started = []
+    monkeypatch.setattr(utils.threading.Thread, "start", lambda self: started.append(self))
+    assert isinstance(utils._cpu_percent(), float)
+    assert started == []
+
+
+def test_lazy_cpu_percent_seeds_once_and_starts_one_sampler(monkeypatch):
+    monkeypatch.setattr(utils, "_cpu_thread", None)
+    monkeypatch.setattr(utils, "_cpu_last", None)
+    started = []
+    monkeypatch.setattr(utils.threading.Thread, "start", lambda self: started.append(self))
+
+    first = utils._cpu_percent(lazy=True)
+    assert isinstance(first, float)
+    assert len(started) == 1 and started[0].daemon
+
+    # later calls read the cached value and never start another thread
+    assert utils._cpu_percent(lazy=True) == first
+    assert utils._cpu_percent(lazy=True) == first
+    assert len(started) == 1